@@ -4,48 +4,132 @@ Provides REST endpoints for task management, import/export, and announcement sum
 """
 
 import asyncio
+import calendar
+import itertools
 import json
 import logging
+import logging.handlers
 import os
+import queue
+import re
 import tempfile
 import uuid
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Any
-import threading
+from urllib.parse import parse_qsl
 import time
 
-from dateutil.relativedelta import relativedelta
-from fastapi import FastAPI, HTTPException, Query, File, UploadFile, BackgroundTasks
+import aiofiles
+import orjson
+from sortedcontainers import SortedKeyList
+from fastapi import FastAPI, HTTPException, Query, File, UploadFile, BackgroundTasks, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
-from pydantic import BaseModel, Field, validator
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, Field, PrivateAttr, validator
 import uvicorn
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
 
-# Configure logging
+
+# Configure logging: hot-path log calls only enqueue the record; a
+# QueueListener thread does the blocking file/stream writes off the
+# request path
+_log_queue: "queue.Queue" = queue.Queue(-1)
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_file_handler = logging.FileHandler('task_backend.log')
+_log_file_handler.setFormatter(_log_formatter)
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(_log_formatter)
+log_listener = logging.handlers.QueueListener(
+    _log_queue, _log_file_handler, _log_stream_handler, respect_handler_level=True
+)
+log_listener.start()
+
+# Plain passthrough format: QueueHandler.prepare() bakes this into the
+# record, and the listener's handlers apply the real format exactly once
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('task_backend.log'),
-        logging.StreamHandler()
-    ]
+    format='%(message)s',
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
 # Global configuration
 DATA_DIR = Path("public/data")
 TASKS_FILE = DATA_DIR / "tasks.json"
+WAL_FILE = DATA_DIR / "tasks.wal"
+LOCK_FILE = DATA_DIR / "tasks.lock"
 CACHE_EXPIRATION = 10  # seconds
 MAX_UPLOAD_SIZE = 10 * 1024 * 1024  # 10MB
+LARGE_IMPORT_BYTES = 5 * 1024 * 1024  # imports above this validate in a process pool
+WRITE_DEBOUNCE = 0.1  # seconds to coalesce bursts of mutations into one write
+WAL_COMPACT_OPS = 1000  # rewrite the snapshot after this many WAL records
+WAL_COMPACT_INTERVAL = 60.0  # or after this many seconds since the last one
+
+# Durability policy for task file writes:
+#   per_write - fsync the WAL on every append and the snapshot on every write
+#   group     - fsync only at compaction, amortizing the flush across the
+#               debounce window (WAL appends still reach the OS immediately)
+#   none      - never fsync; fastest, survives process crash but not power loss
+DURABILITY = os.environ.get('TASKS_DURABILITY', 'group')
 
 # Ensure data directory exists
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-# Thread-safe file lock and cache
-file_lock = threading.Lock()
-task_cache = {"data": None, "expires_at": 0}
+# In-memory task cache; the asyncio primitives below serialize writers.
+# "index" maps id -> list position; "filters" holds the secondary
+# date/category/sort indexes used to answer filtered queries; "raw_bytes"
+# keeps the preformatted JSON served to unfiltered GETs.
+task_cache = {
+    "data": None,
+    "index": None,
+    "filters": None,
+    "raw_bytes": None,
+    "expires_at": 0,
+    "dirty": False,
+}
+
+# Write-coalescing state: mutations enqueue a wakeup, a single background
+# task drains the queue and performs one atomic write per debounce window.
+# The queue and lock are created in the lifespan handler so they bind to
+# the running event loop.
+state_lock: Optional[asyncio.Lock] = None
+write_queue: Optional["asyncio.Queue[None]"] = None
+writer_task: Optional[asyncio.Task] = None
+
+# Guards cache fill only: readers hitting a warm cache take no lock, and
+# the writeback path is a single consumer that needs no reader lock
+cache_lock: Optional[asyncio.Lock] = None
+
+# Lazily-created pool for validating very large imports in a separate
+# process, keeping CPU-bound validation off this worker's GIL
+_import_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_import_pool() -> ProcessPoolExecutor:
+    global _import_pool
+    if _import_pool is None:
+        _import_pool = ProcessPoolExecutor(max_workers=1)
+    return _import_pool
+
+# Precompiled sanitization helpers shared by the Task validators:
+# translation table stripping control characters (keeping \n and \t),
+# a script-tag neutralizer, and a category allow-list pattern
+_CTRL_TABLE = {c: None for c in range(32) if chr(c) not in '\n\t'}
+_SCRIPT_RE = re.compile(r'</script>|<script', re.IGNORECASE)
+_CATEGORY_DISALLOWED_RE = re.compile(r'[^\w\-. ]')
+
+# Write-ahead log state: mutations append one JSON-Lines record each, and
+# the snapshot (tasks.json) is only rewritten when the compaction
+# threshold trips. Tasks touched since the last WAL append collect here.
+wal_state = {"file": None, "ops": 0, "last_compact": time.time()}
+pending_wal: List["Task"] = []
 
 
 class Frequency(BaseModel):
@@ -55,6 +139,26 @@ class Frequency(BaseModel):
     days_of_week: Optional[List[int]] = Field(default=None, description="0=Monday, 6=Sunday")
     day_of_month: Optional[int] = Field(default=None, ge=1, le=31)
 
+    # Memoized weekday -> days-until-next-occurrence table for weekly
+    # recurrence; the mapping is fixed for a given days_of_week set
+    _days_ahead: Optional[tuple] = PrivateAttr(default=None)
+
+    def days_ahead_table(self) -> tuple:
+        """Return a 7-entry table mapping current weekday to the number of
+        days until the next occurrence in days_of_week, built once."""
+        if self._days_ahead is None:
+            target_days = sorted(self.days_of_week)
+            table = []
+            for weekday in range(7):
+                next_day = next((d for d in target_days if d > weekday), None)
+                if next_day is None:
+                    # Next occurrence wraps to the first target day next week
+                    table.append((7 - weekday) + target_days[0])
+                else:
+                    table.append(next_day - weekday)
+            self._days_ahead = tuple(table)
+        return self._days_ahead
+
 
 class Reminder(BaseModel):
     """Task reminder configuration."""
@@ -78,20 +182,28 @@ class Task(BaseModel):
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
+    # Memoized dict form; tasks are immutable between mutations, so the
+    # serialized shape only changes when update_timestamp runs
+    _serialized: Optional[dict] = PrivateAttr(default=None)
+
     @validator('description')
     def sanitize_description(cls, v):
         """Sanitize description field to remove control characters and scripts."""
         if not v:
             raise ValueError('Description cannot be empty')
-        # Remove control characters and potential script tags
-        sanitized = ''.join(char for char in v if ord(char) >= 32 or char in '\n\t')
-        sanitized = sanitized.replace('<script', '&lt;script').replace('</script>', '&lt;/script&gt;')
+        # Remove control characters and potential script tags via
+        # precompiled table/regex instead of a per-character Python loop
+        sanitized = v.translate(_CTRL_TABLE)
+        sanitized = _SCRIPT_RE.sub(
+            lambda m: '&lt;/script&gt;' if m.group(0).startswith('</') else '&lt;script',
+            sanitized
+        )
         return sanitized.strip()
 
     @validator('category')
     def sanitize_category(cls, v):
         """Sanitize category field."""
-        sanitized = ''.join(char for char in v if char.isalnum() or char in '_-. ')
+        sanitized = _CATEGORY_DISALLOWED_RE.sub('', v)
         return sanitized.strip() or "general"
 
     @validator('due_date', 'next_due_date', 'completed_at', pre=True)
@@ -109,9 +221,16 @@ class Task(BaseModel):
                 raise ValueError(f'Invalid datetime format: {v}')
         return v
 
+    def to_serializable(self) -> dict:
+        """Return the task as a plain dict, cached between mutations."""
+        if self._serialized is None:
+            self._serialized = self.dict()
+        return self._serialized
+
     def update_timestamp(self):
-        """Update the updated_at timestamp."""
+        """Update the updated_at timestamp and drop the memoized dict."""
         self.updated_at = datetime.now(timezone.utc)
+        self._serialized = None
 
 
 class TaskCreate(BaseModel):
@@ -137,6 +256,31 @@ class CompleteTaskRequest(BaseModel):
     auto_reschedule: bool = Field(default=True)
 
 
+class BatchOperation(BaseModel):
+    """A single sub-request inside a batch call."""
+    id: str = Field(..., min_length=1, max_length=100)
+    method: str = Field(..., regex="^(GET|POST|PUT)$")
+    url: str = Field(..., min_length=1, max_length=500)
+    body: Optional[Dict[str, Any]] = None
+
+
+class BatchOperationResult(BaseModel):
+    """Result of a single batch sub-request."""
+    id: str
+    status: int
+    body: Optional[Any] = None
+
+
+class BatchRequest(BaseModel):
+    """Batch of task operations executed with one load/save cycle."""
+    requests: List[BatchOperation] = Field(..., min_items=1, max_items=100)
+
+
+class BatchResponse(BaseModel):
+    """Per-operation results for a batch call."""
+    responses: List[BatchOperationResult]
+
+
 class ImportSummary(BaseModel):
     """Summary of import operation."""
     success_count: int
@@ -156,138 +300,430 @@ class AnnouncementSummary(BaseModel):
 def calculate_next_due_date(current_due: datetime, frequency: Frequency) -> datetime:
     """
     Calculate the next due date based on frequency configuration.
-    Uses dateutil.relativedelta for precise date arithmetic.
+    Uses plain datetime/calendar arithmetic for precise date math.
     """
     if frequency.type == "daily":
         return current_due + timedelta(days=frequency.interval)
     
     elif frequency.type == "weekly":
         if frequency.days_of_week:
-            # Find next occurrence of specified weekdays
-            current_weekday = current_due.weekday()
-            target_days = sorted(frequency.days_of_week)
-            
-            # Find next target day
-            next_day = None
-            for day in target_days:
-                if day > current_weekday:
-                    next_day = day
-                    break
-            
-            if next_day is None:
-                # Next occurrence is next week
-                next_day = target_days[0]
-                days_ahead = (7 - current_weekday) + next_day
-            else:
-                days_ahead = next_day - current_weekday
-            
-            return current_due + timedelta(days=days_ahead)
+            # Table lookup instead of re-sorting and scanning per call
+            return current_due + timedelta(days=frequency.days_ahead_table()[current_due.weekday()])
         else:
             return current_due + timedelta(weeks=frequency.interval)
     
     elif frequency.type == "monthly":
-        next_date = current_due + relativedelta(months=frequency.interval)
-        
-        if frequency.day_of_month:
-            # Try to set specific day of month, fall back to last day if overflow
-            try:
-                next_date = next_date.replace(day=frequency.day_of_month)
-            except ValueError:
-                # Day doesn't exist in target month (e.g., Feb 31), use last day
-                next_month = next_date + relativedelta(months=1)
-                last_day = (next_month.replace(day=1) - timedelta(days=1)).day
-                next_date = next_date.replace(day=last_day)
-        
-        return next_date
-    
+        # Plain month arithmetic, clamping to the last day of the target
+        # month if the requested day overflows (e.g. Feb 31)
+        total_months = current_due.month - 1 + frequency.interval
+        year = current_due.year + total_months // 12
+        month = total_months % 12 + 1
+        day = min(
+            frequency.day_of_month or current_due.day,
+            calendar.monthrange(year, month)[1]
+        )
+        return current_due.replace(year=year, month=month, day=day)
+
     elif frequency.type == "yearly":
-        return current_due + relativedelta(years=frequency.interval)
-    
+        try:
+            return current_due.replace(year=current_due.year + frequency.interval)
+        except ValueError:
+            # Feb 29 in a non-leap target year; clamp to Feb 28
+            return current_due.replace(year=current_due.year + frequency.interval, day=28)
+
     else:
         raise ValueError(f"Unsupported frequency type: {frequency.type}")
 
 
+def _task_from_trusted(item: dict) -> Task:
+    """
+    Build a Task from our own previously-validated on-disk data using
+    construct(), skipping the validators that already ran on ingress.
+    Datetimes are coerced manually and nested models built the same way;
+    untrusted input (imports, dry runs) must keep going through Task(**item).
+    """
+    data = dict(item)
+
+    for field in ('due_date', 'completed_at', 'next_due_date', 'created_at', 'updated_at'):
+        value = data.get(field)
+        if isinstance(value, str):
+            dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+            # Mirror the ingress validator: naive timestamps are UTC, so
+            # comparisons against timezone-aware now() stay valid
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=timezone.utc)
+            data[field] = dt
+
+    frequency = data.get('frequency')
+    if isinstance(frequency, dict):
+        data['frequency'] = Frequency.construct(**frequency)
+
+    data['reminders'] = [
+        Reminder.construct(**r) if isinstance(r, dict) else r
+        for r in data.get('reminders') or []
+    ]
+
+    return Task.construct(**data)
+
+
+def build_task_index(tasks: List[Task]) -> Dict[str, int]:
+    """Build and cache an id -> list position index for O(1) task lookups."""
+    index = {task.id: i for i, task in enumerate(tasks)}
+    task_cache["index"] = index
+    return index
+
+
+def get_task_index(tasks: List[Task]) -> Dict[str, int]:
+    """Return the cached id -> position index, rebuilding it if stale."""
+    index = task_cache["index"]
+    if index is None or len(index) != len(tasks):
+        index = build_task_index(tasks)
+    return index
+
+
+def build_filter_indexes(tasks: List[Task]) -> Dict[str, Any]:
+    """Build the secondary indexes used to answer filtered queries: date
+    and category buckets plus a due-date-sorted view for range scans."""
+    by_due_date: Dict[Any, List[Task]] = {}
+    by_category: Dict[str, List[Task]] = {}
+    for task in tasks:
+        by_due_date.setdefault(task.due_date.date(), []).append(task)
+        by_category.setdefault(task.category.lower(), []).append(task)
+    return {
+        "by_due_date": by_due_date,
+        "by_category": by_category,
+        "due_sorted": SortedKeyList(tasks, key=lambda t: t.due_date),
+    }
+
+
+def invalidate_query_caches() -> None:
+    """Drop the derived query caches (secondary indexes and preformatted
+    bytes) after any in-place task mutation, so reads issued before the
+    next schedule_save — e.g. later sub-requests in a batch — rebuild
+    them from current data."""
+    task_cache["filters"] = None
+    task_cache["raw_bytes"] = None
+
+
+def get_filter_indexes(tasks: List[Task]) -> Dict[str, Any]:
+    """Return the cached secondary indexes, rebuilding them if invalidated.
+
+    Indexes are only cached when they describe the cached task list, so a
+    caller passing an arbitrary list still gets correct (uncached) results.
+    """
+    indexes = task_cache["filters"]
+    if indexes is None or task_cache["data"] is not tasks:
+        indexes = build_filter_indexes(tasks)
+        if task_cache["data"] is tasks:
+            task_cache["filters"] = indexes
+    return indexes
+
+
 async def load_tasks() -> List[Task]:
     """Load tasks from JSON file with caching and validation."""
     current_time = time.time()
-    
-    # Check cache first
-    if task_cache["data"] and current_time < task_cache["expires_at"]:
+
+    # Check cache first; while a writeback is pending the in-memory copy is
+    # the source of truth and must not be re-read from the (stale) file
+    if task_cache["data"] is not None and (task_cache["dirty"] or current_time < task_cache["expires_at"]):
         return task_cache["data"]
-    
-    with file_lock:
+
+    # Cold cache: serialize the fill so concurrent misses don't all hit disk
+    lock = cache_lock if cache_lock is not None else asyncio.Lock()
+    async with lock:
+        # Double-check: another request may have filled the cache while we
+        # waited for the lock, making this a memory hit instead of a read
+        current_time = time.time()
+        if task_cache["data"] is not None and (task_cache["dirty"] or current_time < task_cache["expires_at"]):
+            return task_cache["data"]
+
         try:
-            if TASKS_FILE.exists():
-                with open(TASKS_FILE, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                tasks = []
+            snapshot_exists = TASKS_FILE.exists()
+            wal_exists = WAL_FILE.exists() and WAL_FILE.stat().st_size > 0
+
+            if not snapshot_exists and not wal_exists:
+                return []
+
+            tasks = []
+            if snapshot_exists:
+                # Non-blocking read so the event loop keeps servicing requests
+                async with aiofiles.open(TASKS_FILE, 'rb') as f:
+                    raw = await f.read()
+                data = orjson.loads(raw)
+
                 for item in data:
                     try:
-                        task = Task(**item)
+                        # Data we wrote ourselves already passed validation
+                        task = _task_from_trusted(item)
                         tasks.append(task)
                     except Exception as e:
                         logger.warning(f"Skipping invalid task {item.get('id', 'unknown')}: {e}")
-                
-                # Update cache
-                task_cache["data"] = tasks
-                task_cache["expires_at"] = current_time + CACHE_EXPIRATION
-                
-                return tasks
-            else:
-                return []
-                
+
+            # Fold in any ops written since the snapshot was last compacted
+            if wal_exists:
+                async with aiofiles.open(WAL_FILE, 'rb') as f:
+                    raw_wal = await f.read()
+                tasks = _replay_wal(tasks, raw_wal)
+
+            # Update cache
+            task_cache["data"] = tasks
+            build_task_index(tasks)
+            invalidate_query_caches()
+            task_cache["expires_at"] = current_time + CACHE_EXPIRATION
+
+            return tasks
+
         except Exception as e:
             logger.error(f"Error loading tasks: {e}")
             return []
 
 
-async def save_tasks(tasks: List[Task]) -> bool:
-    """Save tasks to JSON file with atomic writes and validation."""
-    with file_lock:
+@contextmanager
+def _file_write_lock():
+    """
+    Advisory cross-process lock around task file writes, so multiple
+    uvicorn workers sharing the data directory can't interleave WAL
+    appends or snapshot replacements. No-op where flock is unavailable.
+    """
+    if fcntl is None:
+        yield
+        return
+    with open(LOCK_FILE, 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
         try:
-            # Prepare data for serialization
-            data = []
-            for task in tasks:
-                task_dict = task.dict()
-                # Convert datetime objects to ISO strings
-                for field in ['due_date', 'completed_at', 'next_due_date', 'created_at', 'updated_at']:
-                    if task_dict.get(field):
-                        task_dict[field] = task_dict[field].isoformat()
-                data.append(task_dict)
-            
-            # Atomic write: write to temp file, then rename
-            with tempfile.NamedTemporaryFile(
-                mode='w', 
-                suffix='.json', 
-                dir=DATA_DIR, 
-                delete=False,
-                encoding='utf-8'
-            ) as temp_file:
-                json.dump(data, temp_file, indent=2, ensure_ascii=False)
-                temp_file.flush()
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _fsync_dir() -> None:
+    """fsync the data directory so a completed rename itself is durable."""
+    if hasattr(os, 'O_DIRECTORY'):
+        dir_fd = os.open(str(DATA_DIR), os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def _atomic_write(payload: bytes) -> None:
+    """
+    Blocking atomic write: dump the serialized payload to a temp file,
+    fsync, then os.replace over tasks.json. The caller must already hold
+    _file_write_lock.
+    """
+    temp_path = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            mode='wb',
+            suffix='.json',
+            dir=DATA_DIR,
+            delete=False
+        ) as temp_file:
+            temp_file.write(payload)
+            temp_file.flush()
+            if DURABILITY != 'none':
                 os.fsync(temp_file.fileno())
-                temp_path = temp_file.name
-            
-            # Atomic rename
-            os.rename(temp_path, TASKS_FILE)
-            
-            # Invalidate cache
-            task_cache["data"] = None
-            task_cache["expires_at"] = 0
-            
-            logger.info(f"Successfully saved {len(tasks)} tasks")
-            return True
-            
+            temp_path = temp_file.name
+
+        # os.replace is atomic on both POSIX and Windows
+        os.replace(temp_path, TASKS_FILE)
+        if DURABILITY != 'none':
+            _fsync_dir()
+
+    except Exception:
+        # Clean up temp file if it exists
+        try:
+            if temp_path:
+                os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _wal_append(records: List[dict]) -> None:
+    """
+    Blocking append of JSON-Lines op records to tasks.wal. The file handle
+    is kept open between calls; runs in a worker thread via schedule_save.
+    """
+    f = wal_state["file"]
+    if f is None or f.closed:
+        f = wal_state["file"] = open(WAL_FILE, 'ab')
+    with _file_write_lock():
+        for record in records:
+            f.write(orjson.dumps(record) + b"\n")
+        f.flush()
+        if DURABILITY == 'per_write':
+            if hasattr(os, 'fdatasync'):
+                os.fdatasync(f.fileno())
+            else:  # Windows
+                os.fsync(f.fileno())
+
+
+def _truncate_wal() -> None:
+    """Blocking truncate of tasks.wal after a successful compaction.
+    The caller must already hold _file_write_lock."""
+    f = wal_state["file"]
+    if f is not None and not f.closed:
+        f.close()
+    wal_state["file"] = None
+    if WAL_FILE.exists():
+        with open(WAL_FILE, 'wb'):
+            pass
+
+
+def _replay_wal(tasks: List[Task], raw_wal: bytes) -> List[Task]:
+    """Fold WAL op records, in order, into the snapshot task list."""
+    index = {task.id: i for i, task in enumerate(tasks)}
+    replayed = 0
+
+    for line in raw_wal.splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = orjson.loads(line)
+            if record.get("op") != "upsert":
+                continue
+            # WAL records were written by us post-validation
+            task = _task_from_trusted(record["task"])
         except Exception as e:
-            logger.error(f"Error saving tasks: {e}")
-            # Clean up temp file if it exists
-            try:
-                if 'temp_path' in locals():
-                    os.unlink(temp_path)
-            except:
-                pass
-            return False
+            logger.warning(f"Skipping invalid WAL record: {e}")
+            continue
+
+        i = index.get(task.id)
+        if i is None:
+            index[task.id] = len(tasks)
+            tasks.append(task)
+        else:
+            tasks[i] = task
+        replayed += 1
+
+    if replayed:
+        wal_state["ops"] = replayed
+        logger.info(f"Replayed {replayed} WAL records")
+    return tasks
+
+
+def _compact_sync() -> int:
+    """
+    Blocking compaction, entirely inside the cross-process lock: rebuild
+    the task list from the on-disk snapshot plus the WAL, atomically
+    write the merged result back, then truncate the WAL. Every
+    acknowledged write — from any worker — is in the snapshot or the WAL
+    before the writer is woken, so disk state is the complete base; this
+    worker's in-memory list is not, since it can predate compactions
+    other workers have performed. Returns the number of tasks written.
+    """
+    with _file_write_lock():
+        tasks: List[Task] = []
+        if TASKS_FILE.exists():
+            with open(TASKS_FILE, 'rb') as f:
+                raw = f.read()
+            for item in (orjson.loads(raw) if raw else []):
+                try:
+                    tasks.append(_task_from_trusted(item))
+                except Exception as e:
+                    logger.warning(f"Skipping invalid task {item.get('id', 'unknown')}: {e}")
+
+        if WAL_FILE.exists() and WAL_FILE.stat().st_size > 0:
+            with open(WAL_FILE, 'rb') as f:
+                raw_wal = f.read()
+            tasks = _replay_wal(tasks, raw_wal)
+
+        # orjson serializes datetimes to ISO 8601 natively; to_serializable
+        # reuses each task's memoized dict so unchanged tasks cost nothing
+        payload = orjson.dumps([task.to_serializable() for task in tasks], option=orjson.OPT_INDENT_2)
+        _atomic_write(payload)
+        _truncate_wal()
+
+    return len(tasks)
+
+
+async def save_tasks() -> bool:
+    """Compact the on-disk snapshot and WAL into a fresh tasks.json."""
+    try:
+        # Offload the blocking merge+write so fsync doesn't stall the loop
+        saved_count = await asyncio.to_thread(_compact_sync)
+
+        # Deliberately no expires_at refresh: the merged file can contain
+        # other workers' tasks this cache has never seen, so let the normal
+        # expiry re-read pick them up within CACHE_EXPIRATION
+
+        logger.info(f"Successfully saved {saved_count} tasks")
+        return True
+
+    except Exception as e:
+        logger.error(f"Error saving tasks: {e}")
+        return False
+
+
+async def schedule_save(tasks: List[Task]) -> None:
+    """
+    Publish a mutated task list to the in-memory cache, append WAL records
+    for the touched tasks, and wake the writeback task. The snapshot file
+    itself is only rewritten when the compaction threshold trips.
+    """
+    task_cache["data"] = tasks
+    invalidate_query_caches()
+    task_cache["dirty"] = True
+
+    if pending_wal:
+        records = [{"op": "upsert", "task": task.to_serializable()} for task in pending_wal]
+        pending_wal.clear()
+        lock = state_lock if state_lock is not None else asyncio.Lock()
+        async with lock:
+            await asyncio.to_thread(_wal_append, records)
+        wal_state["ops"] += len(records)
+
+    if write_queue is not None:
+        await write_queue.put(None)
+    else:
+        # No writer running (e.g. module used outside the app); write inline
+        await flush_pending_writes()
+
+
+async def flush_pending_writes() -> None:
+    """
+    Compact: merge the on-disk snapshot and WAL into a fresh snapshot and
+    truncate the WAL it supersedes.
+    """
+    lock = state_lock if state_lock is not None else asyncio.Lock()
+    async with lock:
+        if task_cache["data"] is None or not task_cache["dirty"]:
+            return
+
+        if await save_tasks():
+            task_cache["dirty"] = False
+            wal_state["ops"] = 0
+            wal_state["last_compact"] = time.time()
+
+
+async def drain() -> None:
+    """Drain the write queue and compact immediately (used at shutdown)."""
+    if write_queue is not None:
+        while not write_queue.empty():
+            write_queue.get_nowait()
+    await flush_pending_writes()
+
+
+async def _writer_loop() -> None:
+    """
+    Single background consumer: wait for a mutation signal, debounce so a
+    burst of API calls collapses together, then compact the snapshot if
+    enough WAL records or time have accumulated. Between compactions
+    durability comes from the per-mutation WAL appends.
+    """
+    while True:
+        await write_queue.get()
+        await asyncio.sleep(WRITE_DEBOUNCE)
+        while not write_queue.empty():
+            write_queue.get_nowait()
+        try:
+            if (wal_state["ops"] >= WAL_COMPACT_OPS
+                    or time.time() - wal_state["last_compact"] >= WAL_COMPACT_INTERVAL):
+                await flush_pending_writes()
+        except Exception as e:
+            logger.error(f"Writeback failed: {e}")
 
 
 def filter_tasks(
@@ -298,37 +734,44 @@ def filter_tasks(
     limit: Optional[int] = None,
     offset: int = 0
 ) -> List[Task]:
-    """Filter tasks based on query parameters."""
-    filtered = tasks.copy()
+    """Filter tasks based on query parameters, using the secondary indexes
+    to start from the narrowest pre-bucketed candidate set."""
     now = datetime.now(timezone.utc)
     today = now.date()
     tomorrow = today + timedelta(days=1)
-    
-    # Filter by due date
+
+    indexes = get_filter_indexes(tasks)
+
+    # Pick the narrowest candidate set available for the query; everything
+    # stays lazy until pagination so no intermediate lists are built
     if due_date == "today":
-        filtered = [t for t in filtered if t.due_date.date() == today]
+        filtered = iter(indexes["by_due_date"].get(today, ()))
     elif due_date == "tomorrow":
-        filtered = [t for t in filtered if t.due_date.date() == tomorrow]
-    
+        filtered = iter(indexes["by_due_date"].get(tomorrow, ()))
+    elif category:
+        filtered = iter(indexes["by_category"].get(category.lower(), ()))
+        category = None  # already applied
+    elif status == "overdue":
+        # Range scan over the due-date-sorted view instead of a full pass
+        filtered = indexes["due_sorted"].irange_key(max_key=now, inclusive=(True, False))
+    else:
+        filtered = iter(tasks)
+
     # Filter by status
     if status == "due":
-        filtered = [t for t in filtered if not t.completed and t.due_date.date() <= today]
+        filtered = (t for t in filtered if not t.completed and t.due_date.date() <= today)
     elif status == "overdue":
-        filtered = [t for t in filtered if not t.completed and t.due_date < now]
+        filtered = (t for t in filtered if not t.completed and t.due_date < now)
     elif status == "completed":
-        filtered = [t for t in filtered if t.completed]
-    
+        filtered = (t for t in filtered if t.completed)
+
     # Filter by category
     if category:
-        filtered = [t for t in filtered if t.category.lower() == category.lower()]
-    
-    # Apply pagination
-    if offset:
-        filtered = filtered[offset:]
-    if limit:
-        filtered = filtered[:limit]
-    
-    return filtered
+        category_lower = category.lower()
+        filtered = (t for t in filtered if t.category.lower() == category_lower)
+
+    # Materialize once, applying pagination as a single slice
+    return list(itertools.islice(filtered, offset, (offset + limit) if limit else None))
 
 
 def generate_announcement_text(summary: AnnouncementSummary) -> Dict[str, str]:
@@ -377,11 +820,143 @@ def generate_announcement_text(summary: AnnouncementSummary) -> Dict[str, str]:
     }
 
 
+def _apply_create(tasks: List[Task], task_data: TaskCreate) -> Task:
+    """Create a task against a pre-loaded list; shared by endpoint and batch."""
+    new_task = Task(
+        description=task_data.description,
+        category=task_data.category,
+        due_date=task_data.due_date,
+        frequency=task_data.frequency,
+        reminders=task_data.reminders
+    )
+
+    # Calculate initial next_due_date if frequency is set
+    if new_task.frequency:
+        new_task.next_due_date = calculate_next_due_date(new_task.due_date, new_task.frequency)
+
+    tasks.append(new_task)
+    if task_cache["index"] is not None:
+        task_cache["index"][new_task.id] = len(tasks) - 1
+    pending_wal.append(new_task)
+    invalidate_query_caches()
+
+    return new_task
+
+
+def _apply_update(tasks: List[Task], task_id: str, task_update: TaskUpdate) -> Task:
+    """Update a task in a pre-loaded list; raises 404 if it does not exist."""
+    # O(1) lookup via the cached id -> position index
+    task_index = get_task_index(tasks).get(task_id)
+    if task_index is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    task = tasks[task_index]
+
+    if task_update.description is not None:
+        task.description = task_update.description
+    if task_update.category is not None:
+        task.category = task_update.category
+    if task_update.due_date is not None:
+        task.due_date = task_update.due_date
+    if task_update.frequency is not None:
+        task.frequency = task_update.frequency
+        # Recalculate next due date if frequency changed
+        if task.frequency:
+            task.next_due_date = calculate_next_due_date(task.due_date, task.frequency)
+        else:
+            task.next_due_date = None
+    if task_update.reminders is not None:
+        task.reminders = task_update.reminders
+
+    task.update_timestamp()
+    pending_wal.append(task)
+    invalidate_query_caches()
+    return task
+
+
+def _apply_complete(tasks: List[Task], task_id: str, request: CompleteTaskRequest) -> Task:
+    """Complete a task in a pre-loaded list, rescheduling if requested."""
+    # O(1) lookup via the cached id -> position index
+    task_index = get_task_index(tasks).get(task_id)
+    if task_index is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    task = tasks[task_index]
+
+    # Mark as completed
+    task.completed = True
+    task.completed_at = datetime.now(timezone.utc)
+    task.update_timestamp()
+    pending_wal.append(task)
+
+    # Handle rescheduling
+    if request.auto_reschedule and task.frequency:
+        # Calculate next occurrence
+        next_due = calculate_next_due_date(task.due_date, task.frequency)
+
+        # Create new task for next occurrence
+        new_task = Task(
+            description=task.description,
+            category=task.category,
+            due_date=next_due,
+            frequency=task.frequency,
+            reminders=[Reminder(
+                time_before=r.time_before,
+                message=r.message
+            ) for r in task.reminders]  # Copy reminders but reset sent status
+        )
+
+        # Calculate next_due_date for the new task
+        new_task.next_due_date = calculate_next_due_date(new_task.due_date, new_task.frequency)
+
+        tasks.append(new_task)
+        if task_cache["index"] is not None:
+            task_cache["index"][new_task.id] = len(tasks) - 1
+        pending_wal.append(new_task)
+        logger.info(f"Created recurring task: {new_task.id} for {next_due}")
+
+    invalidate_query_caches()
+    return task
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the writeback task on startup and flush pending writes on shutdown."""
+    global state_lock, write_queue, writer_task, cache_lock, _import_pool
+    if log_listener._thread is None:
+        log_listener.start()
+    state_lock = asyncio.Lock()
+    cache_lock = asyncio.Lock()
+    write_queue = asyncio.Queue()
+    writer_task = asyncio.create_task(_writer_loop())
+    yield
+    writer_task.cancel()
+    try:
+        await writer_task
+    except asyncio.CancelledError:
+        pass
+    writer_task = None
+    await drain()
+    write_queue = None
+    state_lock = None
+    cache_lock = None
+    wal_file = wal_state["file"]
+    if wal_file is not None and not wal_file.closed:
+        wal_file.close()
+    wal_state["file"] = None
+    if _import_pool is not None:
+        _import_pool.shutdown(wait=False)
+        _import_pool = None
+    log_listener.stop()
+
+
 # FastAPI application setup
 app = FastAPI(
     title="Task Management API",
     description="Secure JSON file-based task management with recurrence calculation",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS configuration
@@ -405,6 +980,17 @@ async def get_tasks(
     """Get filtered list of tasks with pagination support."""
     try:
         tasks = await load_tasks()
+
+        # Fast path for the unfiltered list: serve preformatted JSON bytes,
+        # built lazily after the first mutation and reused until the next
+        if due_date is None and status is None and category is None and limit is None and not offset:
+            raw = task_cache["raw_bytes"]
+            if raw is None:
+                raw = orjson.dumps([t.to_serializable() for t in tasks], option=orjson.OPT_INDENT_2)
+                task_cache["raw_bytes"] = raw
+            logger.info(f"Retrieved {len(tasks)} tasks (unfiltered, cached bytes)")
+            return Response(content=raw, media_type="application/json")
+
         filtered_tasks = filter_tasks(tasks, due_date, status, category, limit, offset)
         
         logger.info(f"Retrieved {len(filtered_tasks)} tasks (filters: due_date={due_date}, status={status}, category={category})")
@@ -420,28 +1006,12 @@ async def create_task(task_data: TaskCreate):
     """Create a new task with schema validation and initial due date calculation."""
     try:
         tasks = await load_tasks()
-        
-        # Create new task
-        new_task = Task(
-            description=task_data.description,
-            category=task_data.category,
-            due_date=task_data.due_date,
-            frequency=task_data.frequency,
-            reminders=task_data.reminders
-        )
-        
-        # Calculate initial next_due_date if frequency is set
-        if new_task.frequency:
-            new_task.next_due_date = calculate_next_due_date(new_task.due_date, new_task.frequency)
-        
-        tasks.append(new_task)
-        
-        if await save_tasks(tasks):
-            logger.info(f"Created new task: {new_task.id}")
-            return new_task
-        else:
-            raise HTTPException(status_code=500, detail="Failed to save task")
-            
+        new_task = _apply_create(tasks, task_data)
+
+        await schedule_save(tasks)
+        logger.info(f"Created new task: {new_task.id}")
+        return new_task
+
     except Exception as e:
         logger.error(f"Error creating task: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -452,44 +1022,12 @@ async def update_task(task_id: str, task_update: TaskUpdate):
     """Update an existing task with validation."""
     try:
         tasks = await load_tasks()
-        
-        # Find task
-        task_index = None
-        for i, task in enumerate(tasks):
-            if task.id == task_id:
-                task_index = i
-                break
-        
-        if task_index is None:
-            raise HTTPException(status_code=404, detail="Task not found")
-        
-        # Update fields
-        task = tasks[task_index]
-        
-        if task_update.description is not None:
-            task.description = task_update.description
-        if task_update.category is not None:
-            task.category = task_update.category
-        if task_update.due_date is not None:
-            task.due_date = task_update.due_date
-        if task_update.frequency is not None:
-            task.frequency = task_update.frequency
-            # Recalculate next due date if frequency changed
-            if task.frequency:
-                task.next_due_date = calculate_next_due_date(task.due_date, task.frequency)
-            else:
-                task.next_due_date = None
-        if task_update.reminders is not None:
-            task.reminders = task_update.reminders
-        
-        task.update_timestamp()
-        
-        if await save_tasks(tasks):
-            logger.info(f"Updated task: {task_id}")
-            return task
-        else:
-            raise HTTPException(status_code=500, detail="Failed to save task")
-            
+        task = _apply_update(tasks, task_id, task_update)
+
+        await schedule_save(tasks)
+        logger.info(f"Updated task: {task_id}")
+        return task
+
     except HTTPException:
         raise
     except Exception as e:
@@ -502,53 +1040,12 @@ async def complete_task(task_id: str, request: CompleteTaskRequest = CompleteTas
     """Mark task as completed and optionally reschedule based on frequency."""
     try:
         tasks = await load_tasks()
-        
-        # Find task
-        task_index = None
-        for i, task in enumerate(tasks):
-            if task.id == task_id:
-                task_index = i
-                break
-        
-        if task_index is None:
-            raise HTTPException(status_code=404, detail="Task not found")
-        
-        task = tasks[task_index]
-        
-        # Mark as completed
-        task.completed = True
-        task.completed_at = datetime.now(timezone.utc)
-        task.update_timestamp()
-        
-        # Handle rescheduling
-        if request.auto_reschedule and task.frequency:
-            # Calculate next occurrence
-            next_due = calculate_next_due_date(task.due_date, task.frequency)
-            
-            # Create new task for next occurrence
-            new_task = Task(
-                description=task.description,
-                category=task.category,
-                due_date=next_due,
-                frequency=task.frequency,
-                reminders=[Reminder(
-                    time_before=r.time_before,
-                    message=r.message
-                ) for r in task.reminders]  # Copy reminders but reset sent status
-            )
-            
-            # Calculate next_due_date for the new task
-            new_task.next_due_date = calculate_next_due_date(new_task.due_date, new_task.frequency)
-            
-            tasks.append(new_task)
-            logger.info(f"Created recurring task: {new_task.id} for {next_due}")
-        
-        if await save_tasks(tasks):
-            logger.info(f"Completed task: {task_id} (auto_reschedule={request.auto_reschedule})")
-            return task
-        else:
-            raise HTTPException(status_code=500, detail="Failed to save task")
-            
+        task = _apply_complete(tasks, task_id, request)
+
+        await schedule_save(tasks)
+        logger.info(f"Completed task: {task_id} (auto_reschedule={request.auto_reschedule})")
+        return task
+
     except HTTPException:
         raise
     except Exception as e:
@@ -556,6 +1053,108 @@ async def complete_task(task_id: str, request: CompleteTaskRequest = CompleteTas
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+def _validate_import_batch(import_data: List[Any], existing_ids: set):
+    """
+    Validate raw import items against the full Task model. CPU-bound, so
+    it runs in a worker thread or process via import_tasks.
+    Returns (new_tasks, skipped_count, invalid_count, errors).
+    """
+    new_tasks = []
+    skipped_count = 0
+    invalid_count = 0
+    errors = []
+    seen_ids = set(existing_ids)
+
+    for i, item in enumerate(import_data):
+        try:
+            # Check for duplicate IDs
+            if isinstance(item, dict) and 'id' in item and item['id'] in seen_ids:
+                skipped_count += 1
+                continue
+
+            task = Task(**item)
+
+            # Calculate next_due_date if frequency is set
+            if task.frequency and not task.next_due_date:
+                task.next_due_date = calculate_next_due_date(task.due_date, task.frequency)
+
+            new_tasks.append(task)
+            seen_ids.add(task.id)
+
+        except Exception as e:
+            invalid_count += 1
+            errors.append(f"Item {i+1}: {str(e)}")
+
+    return new_tasks, skipped_count, invalid_count, errors
+
+
+def _dispatch_batch_operation(op: BatchOperation, tasks: List[Task]):
+    """
+    Route one batch sub-request to the shared task helpers.
+    Returns (status_code, body, mutated).
+    """
+    path, _, query = op.url.partition('?')
+    path = path.rstrip('/')
+    body = op.body or {}
+
+    if op.method == "GET" and path == "/api/tasks":
+        params = dict(parse_qsl(query))
+        filtered = filter_tasks(
+            tasks,
+            params.get("due_date"),
+            params.get("status"),
+            params.get("category"),
+            int(params["limit"]) if "limit" in params else None,
+            int(params.get("offset", 0))
+        )
+        return 200, filtered, False
+
+    if op.method == "POST" and path == "/api/tasks":
+        return 200, _apply_create(tasks, TaskCreate(**body)), True
+
+    if op.method == "POST" and path.startswith("/api/tasks/") and path.endswith("/complete"):
+        task_id = path[len("/api/tasks/"):-len("/complete")]
+        return 200, _apply_complete(tasks, task_id, CompleteTaskRequest(**body)), True
+
+    if op.method == "PUT" and path.startswith("/api/tasks/"):
+        task_id = path[len("/api/tasks/"):]
+        return 200, _apply_update(tasks, task_id, TaskUpdate(**body)), True
+
+    raise HTTPException(status_code=404, detail=f"Unsupported batch operation: {op.method} {path}")
+
+
+@app.post("/api/batch", response_model=BatchResponse)
+async def batch_operations(batch: BatchRequest):
+    """Execute multiple task operations with one round trip and one load/save cycle."""
+    try:
+        tasks = await load_tasks()
+
+        responses = []
+        mutated = False
+
+        for op in batch.requests:
+            try:
+                status_code, result, did_mutate = _dispatch_batch_operation(op, tasks)
+                mutated = mutated or did_mutate
+            except HTTPException as e:
+                status_code, result = e.status_code, {"detail": e.detail}
+            except ValueError as e:
+                # Pydantic validation errors on sub-request bodies
+                status_code, result = 400, {"detail": str(e)}
+            responses.append(BatchOperationResult(id=op.id, status=status_code, body=result))
+
+        # One coalesced save for the whole batch
+        if mutated:
+            await schedule_save(tasks)
+
+        logger.info(f"Batch executed: {len(batch.requests)} operations ({sum(1 for r in responses if r.status < 400)} ok)")
+        return BatchResponse(responses=responses)
+
+    except Exception as e:
+        logger.error(f"Error executing batch: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
 @app.post("/api/tasks/import", response_model=ImportSummary)
 async def import_tasks(file: UploadFile = File(...)):
     """Import tasks from JSON file with validation and deduplication."""
@@ -564,53 +1163,42 @@ async def import_tasks(file: UploadFile = File(...)):
         content = await file.read()
         if len(content) > MAX_UPLOAD_SIZE:
             raise HTTPException(status_code=413, detail="File too large")
-        
-        # Parse JSON
+
+        # Parse JSON off the event loop; uploads can be multi-MB
         try:
-            import_data = json.loads(content.decode('utf-8'))
-        except json.JSONDecodeError as e:
+            import_data = await asyncio.to_thread(orjson.loads, content)
+        except orjson.JSONDecodeError as e:
             raise HTTPException(status_code=400, detail=f"Invalid JSON: {e}")
-        
+
         if not isinstance(import_data, list):
             raise HTTPException(status_code=400, detail="JSON must be an array of tasks")
-        
+
         # Load existing tasks
         existing_tasks = await load_tasks()
         existing_ids = {task.id for task in existing_tasks}
-        
-        # Process imported tasks
-        success_count = 0
-        skipped_count = 0
-        invalid_count = 0
-        errors = []
-        
-        for i, item in enumerate(import_data):
-            try:
-                # Create task object for validation
-                if isinstance(item, dict) and 'id' in item:
-                    # Check for duplicate IDs
-                    if item['id'] in existing_ids:
-                        skipped_count += 1
-                        continue
-                
-                task = Task(**item)
-                
-                # Calculate next_due_date if frequency is set
-                if task.frequency and not task.next_due_date:
-                    task.next_due_date = calculate_next_due_date(task.due_date, task.frequency)
-                
-                existing_tasks.append(task)
-                existing_ids.add(task.id)
-                success_count += 1
-                
-            except Exception as e:
-                invalid_count += 1
-                errors.append(f"Item {i+1}: {str(e)}")
-        
+
+        # Validate items off the event loop too; very large imports go to a
+        # process pool so the GIL doesn't stall concurrent requests either
+        if len(content) > LARGE_IMPORT_BYTES:
+            loop = asyncio.get_running_loop()
+            new_tasks, skipped_count, invalid_count, errors = await loop.run_in_executor(
+                _get_import_pool(), _validate_import_batch, import_data, existing_ids
+            )
+        else:
+            new_tasks, skipped_count, invalid_count, errors = await asyncio.to_thread(
+                _validate_import_batch, import_data, existing_ids
+            )
+
+        success_count = len(new_tasks)
+        for task in new_tasks:
+            existing_tasks.append(task)
+            if task_cache["index"] is not None:
+                task_cache["index"][task.id] = len(existing_tasks) - 1
+            pending_wal.append(task)
+
         # Save updated tasks
         if success_count > 0:
-            if not await save_tasks(existing_tasks):
-                raise HTTPException(status_code=500, detail="Failed to save imported tasks")
+            await schedule_save(existing_tasks)
         
         summary = ImportSummary(
             success_count=success_count,
@@ -635,22 +1223,16 @@ async def export_tasks():
     try:
         tasks = await load_tasks()
         
-        # Convert to serializable format
-        export_data = []
-        for task in tasks:
-            task_dict = task.dict()
-            # Convert datetime objects to ISO strings
-            for field in ['due_date', 'completed_at', 'next_due_date', 'created_at', 'updated_at']:
-                if task_dict.get(field):
-                    task_dict[field] = task_dict[field].isoformat()
-            export_data.append(task_dict)
-        
-        # Create JSON string
-        json_content = json.dumps(export_data, indent=2, ensure_ascii=False)
-        
-        # Return as streaming response
+        # Stream one orjson-encoded task per chunk instead of building the
+        # whole document up front: first byte goes out immediately and peak
+        # memory stays at roughly one task
         def generate():
-            yield json_content
+            yield b'['
+            separator = b''
+            for task in tasks:
+                yield separator + orjson.dumps(task.to_serializable())
+                separator = b','
+            yield b']'
         
         filename = f"tasks_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         
@@ -674,26 +1256,25 @@ async def get_announcement_summary():
         today = now.date()
         tomorrow = today + timedelta(days=1)
         
-        # Filter tasks for announcements
+        # Date-bucket lookups replace three separate passes over every task
+        indexes = get_filter_indexes(tasks)
         today_uncompleted = [
-            t for t in tasks 
-            if not t.completed and t.due_date.date() == today
+            t for t in indexes["by_due_date"].get(today, ())
+            if not t.completed
         ]
-        
         tomorrow_tasks = [
-            t for t in tasks 
-            if not t.completed and t.due_date.date() == tomorrow
+            t for t in indexes["by_due_date"].get(tomorrow, ())
+            if not t.completed
         ]
-        
+        # The sorted range scan already comes back ordered by due date
         today_overdue = [
-            t for t in tasks 
-            if not t.completed and t.due_date < now and t.due_date.date() < today
+            t for t in indexes["due_sorted"].irange_key(max_key=now, inclusive=(True, False))
+            if not t.completed and t.due_date.date() < today
         ]
-        
-        # Sort by due date
+
+        # Sort by due date (the overdue list is pre-sorted by the index)
         today_uncompleted.sort(key=lambda x: x.due_date)
         tomorrow_tasks.sort(key=lambda x: x.due_date)
-        today_overdue.sort(key=lambda x: x.due_date)
         
         summary = AnnouncementSummary(
             today_uncompleted=today_uncompleted,
@@ -727,6 +1308,29 @@ def run_dev_server(host: str = "127.0.0.1", port: int = 8000):
     uvicorn.run(app, host=host, port=port, reload=True)
 
 
+def run_prod_server(host: str = "0.0.0.0", port: int = 8000, workers: Optional[int] = None):
+    """
+    Run production server: multiple workers, no auto-reloader, and
+    uvicorn's fastest available loop/http implementations (uvloop and
+    httptools when installed). Each worker keeps its own cache (coherent within
+    CACHE_EXPIRATION); concurrent file writes across workers are
+    serialized by the advisory lock in _file_write_lock.
+    """
+    if workers is None:
+        workers = (os.cpu_count() or 1) * 2 + 1
+    print(f"Starting production server on http://{host}:{port} ({workers} workers)")
+    print("Data directory:", DATA_DIR.absolute())
+    uvicorn.run(
+        "src.components.backend_api:app",
+        host=host,
+        port=port,
+        workers=workers,
+        loop="auto",
+        http="auto",
+        log_level="warning"
+    )
+
+
 def dry_run_import(file_path: str):
     """Perform a dry-run import validation."""
     try:
@@ -763,11 +1367,14 @@ if __name__ == "__main__":
     if len(sys.argv) > 1:
         if sys.argv[1] == "dev":
             run_dev_server()
+        elif sys.argv[1] == "prod":
+            run_prod_server()
         elif sys.argv[1] == "dry-run" and len(sys.argv) > 2:
             dry_run_import(sys.argv[2])
         else:
             print("Usage:")
             print("  python backend_api.py dev                    # Run development server")
+            print("  python backend_api.py prod                   # Run production server (multi-worker)")
             print("  python backend_api.py dry-run <file.json>    # Validate import file")
     else:
         run_dev_server()
\ No newline at end of file